@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from clink.models import ResolvedCLIClient
 
 from .base import AgentOutput, BaseCLIAgent, CLIAgentError
@@ -9,16 +14,25 @@ from .claude import ClaudeAgent
 from .codex import CodexAgent
 from .gemini import GeminiAgent
 
-_AGENTS: dict[str, type[BaseCLIAgent]] = {
-    "gemini": GeminiAgent,
-    "codex": CodexAgent,
-    "claude": ClaudeAgent,
-}
+# Read-only view with interned keys: lookups hit the identity fast path and
+# the builtin registry cannot be mutated behind the memoized resolver's back.
+_AGENTS: Mapping[str, type[BaseCLIAgent]] = MappingProxyType(
+    {
+        sys.intern("gemini"): GeminiAgent,
+        sys.intern("codex"): CodexAgent,
+        sys.intern("claude"): ClaudeAgent,
+    }
+)
+
+
+@lru_cache(maxsize=32)
+def _agent_class_for(runner_or_name: str) -> type[BaseCLIAgent]:
+    """Resolve the agent class for a runner/CLI name, memoized per unique key."""
+    return _AGENTS.get(sys.intern(runner_or_name.lower()), BaseCLIAgent)
 
 
 def create_agent(client: ResolvedCLIClient) -> BaseCLIAgent:
-    agent_key = (client.runner or client.name).lower()
-    agent_cls = _AGENTS.get(agent_key, BaseCLIAgent)
+    agent_cls = _agent_class_for(client.runner or client.name)
     return agent_cls(client)
 
 
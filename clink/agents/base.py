@@ -19,6 +19,23 @@ from clink.parsers import BaseParser, ParsedCLIResponse, ParserError, get_parser
 
 logger = logging.getLogger("clink.agent")
 
+_EXECUTABLE_PATH_CACHE: dict[str, str] = {}
+
+
+def _resolve_executable_path(executable_name: str) -> str | None:
+    """Resolve an executable via PATH, caching hits to avoid repeated PATH scans.
+
+    Cached entries are revalidated with a single stat so stale paths fall back
+    to a fresh ``shutil.which`` lookup.
+    """
+    cached = _EXECUTABLE_PATH_CACHE.get(executable_name)
+    if cached is not None and os.path.isfile(cached):
+        return cached
+    resolved = shutil.which(executable_name)
+    if resolved is not None:
+        _EXECUTABLE_PATH_CACHE[executable_name] = resolved
+    return resolved
+
 
 @dataclass
 class AgentOutput:
@@ -51,6 +68,8 @@ class BaseCLIAgent:
         self.client = client
         self._parser: BaseParser = get_parser(client.parser)
         self._logger = logging.getLogger(f"clink.runner.{client.name}")
+        # Static part of the command line; only role args vary per run.
+        self._base_command: list[str] = [*client.executable, *client.internal_args, *client.config_args]
 
     async def run(
         self,
@@ -70,7 +89,7 @@ class BaseCLIAgent:
 
         # Resolve executable path for cross-platform compatibility (especially Windows)
         executable_name = command[0]
-        resolved_executable = shutil.which(executable_name)
+        resolved_executable = _resolve_executable_path(executable_name)
         if resolved_executable is None:
             raise CLIAgentError(
                 f"Executable '{executable_name}' not found in PATH for CLI '{self.client.name}'. "
@@ -191,9 +210,7 @@ class BaseCLIAgent:
         )
 
     def _build_command(self, *, role: ResolvedCLIRole, system_prompt: str | None) -> list[str]:
-        base = list(self.client.executable)
-        base.extend(self.client.internal_args)
-        base.extend(self.client.config_args)
+        base = list(self._base_command)
         base.extend(role.role_args)
 
         return base
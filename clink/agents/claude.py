@@ -12,9 +12,7 @@ class ClaudeAgent(BaseCLIAgent):
     """Claude CLI agent with system-prompt injection support."""
 
     def _build_command(self, *, role: ResolvedCLIRole, system_prompt: str | None) -> list[str]:
-        command = list(self.client.executable)
-        command.extend(self.client.internal_args)
-        command.extend(self.client.config_args)
+        command = list(self._base_command)
 
         if system_prompt and "--append-system-prompt" not in self.client.config_args:
             command.extend(["--append-system-prompt", system_prompt])
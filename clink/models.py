@@ -1,7 +1,16 @@
-"""Pydantic models for clink configuration and runtime structures."""
+"""Pydantic models for clink configuration and runtime structures.
+
+Configuration models stay on Pydantic because they validate user-editable
+JSON manifests. The Resolved* runtime structures are plain dataclasses
+(mirroring CLIInternalDefaults in clink.constants): they are built
+exclusively from already-validated data, so they skip Pydantic's validator
+pipeline and per-instance overhead on the request hot path.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -64,29 +73,37 @@ class CLIClientConfig(BaseModel):
         raise TypeError("additional_args must be a list of strings or a single string")
 
 
-class ResolvedCLIRole(BaseModel):
+@dataclass(frozen=True)
+class ResolvedCLIRole:
     """Runtime representation of a CLI role with resolved prompt path."""
 
     name: str
     prompt_path: Path
-    role_args: list[str] = Field(default_factory=list)
+    role_args: tuple[str, ...] = ()
     description: str | None = None
 
 
-class ResolvedCLIClient(BaseModel):
+@dataclass(frozen=True)
+class ResolvedCLIClient:
     """Runtime configuration after merging defaults and validating paths."""
 
     name: str
-    executable: list[str]
+    executable: tuple[str, ...]
     working_dir: Path | None
-    internal_args: list[str] = Field(default_factory=list)
-    config_args: list[str] = Field(default_factory=list)
-    env: dict[str, str] = Field(default_factory=dict)
     timeout_seconds: int
     parser: str
+    roles: Mapping[str, ResolvedCLIRole]
+    internal_args: tuple[str, ...] = ()
+    config_args: tuple[str, ...] = ()
+    env: dict[str, str] = field(default_factory=dict)
     runner: str | None = None
-    roles: dict[str, ResolvedCLIRole]
     output_to_file: OutputCaptureConfig | None = None
+    # Lowered once at construction so registry lookups stay plain dict hits
+    # instead of re-lowercasing the name on every call.
+    name_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_lower", self.name.lower())
 
     def list_roles(self) -> list[str]:
         return list(self.roles.keys())
@@ -2,24 +2,60 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from .base import BaseParser, ParsedCLIResponse, ParserError
 from .claude import ClaudeJSONParser
 from .codex import CodexJSONLParser
 from .gemini import GeminiJSONParser
 
-_PARSER_CLASSES: dict[str, type[BaseParser]] = {
-    CodexJSONLParser.name: CodexJSONLParser,
-    GeminiJSONParser.name: GeminiJSONParser,
-    ClaudeJSONParser.name: ClaudeJSONParser,
-}
+# Read-only view with interned keys: lookups hit the identity fast path and
+# the builtin registry cannot be mutated behind the memoized resolver's back.
+_PARSER_CLASSES: Mapping[str, type[BaseParser]] = MappingProxyType(
+    {
+        sys.intern(CodexJSONLParser.name): CodexJSONLParser,
+        sys.intern(GeminiJSONParser.name): GeminiJSONParser,
+        sys.intern(ClaudeJSONParser.name): ClaudeJSONParser,
+    }
+)
+
 
+@lru_cache(maxsize=32)
+def _parser_class_for(name: str) -> type[BaseParser]:
+    """Resolve the parser class for a name, memoized per unique key.
 
-def get_parser(name: str) -> BaseParser:
-    normalized = (name or "").lower()
-    if normalized not in _PARSER_CLASSES:
+    Unknown names raise ParserError, which lru_cache does not cache, so only
+    successful resolutions are remembered.
+    """
+    normalized = sys.intern((name or "").lower())
+    parser_cls = _PARSER_CLASSES.get(normalized)
+    if parser_cls is None:
         raise ParserError(f"No parser registered for '{name}'")
-    parser_cls = _PARSER_CLASSES[normalized]
-    return parser_cls()
+    return parser_cls
+
+
+# Parsers keep no per-parse state, so one instance per (name, retain_events)
+# combination can be shared by every agent instead of being rebuilt on each
+# construction.
+_PARSER_INSTANCES: dict[tuple[str, bool], BaseParser] = {}
+
+
+def get_parser(name: str, *, retain_events: bool = True) -> BaseParser:
+    """Return the shared parser instance for a registered name.
+
+    Pass retain_events=False for callers that never read the raw event
+    metadata; the parser then skips retaining every decoded event, which
+    halves peak memory on long transcripts.
+    """
+    parser_cls = _parser_class_for(name)
+    key = (parser_cls.name, retain_events)
+    instance = _PARSER_INSTANCES.get(key)
+    if instance is None:
+        instance = _PARSER_INSTANCES.setdefault(key, parser_cls(retain_events=retain_events))
+    return instance
 
 
 __all__ = [
@@ -5,6 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+try:
+    # orjson decodes JSON 2-3x faster than the stdlib and raises a
+    # json.JSONDecodeError subclass, so existing except-clauses keep working.
+    # Shared here so every parser picks it up; it stays optional.
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+
+    json_loads = json.loads
+
 
 @dataclass
 class ParsedCLIResponse:
@@ -23,5 +33,11 @@ class BaseParser:
 
     name: str = "base"
 
+    def __init__(self, *, retain_events: bool = True) -> None:
+        # When disabled, parsers skip copying the full raw event list into
+        # metadata, so large tool-call transcripts stay collectable instead of
+        # being kept alive for callers that only consume the content.
+        self.retain_events = retain_events
+
     def parse(self, stdout: str, stderr: str) -> ParsedCLIResponse:
         raise NotImplementedError("Parsers must implement parse()")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from .base import BaseParser, ParsedCLIResponse, ParserError
+from .base import BaseParser, ParsedCLIResponse, ParserError, json_loads
 
 
 class ClaudeJSONParser(BaseParser):
@@ -18,7 +18,7 @@ class ClaudeJSONParser(BaseParser):
             raise ParserError("Claude CLI returned empty stdout while JSON output was expected")
 
         try:
-            loaded = json.loads(stdout)
+            loaded = json_loads(stdout)
         except json.JSONDecodeError as exc:  # pragma: no cover - defensive logging
             raise ParserError(f"Failed to decode Claude CLI JSON output: {exc}") from exc
 
@@ -28,15 +28,18 @@ class ClaudeJSONParser(BaseParser):
         if isinstance(loaded, dict):
             payload: dict[str, Any] = loaded
         elif isinstance(loaded, list):
-            events = [item for item in loaded if isinstance(item, dict)]
-            result_entry = next(
-                (item for item in events if item.get("type") == "result" or "result" in item),
-                None,
-            )
-            assistant_entry = next(
-                (item for item in reversed(events) if item.get("type") == "assistant"),
-                None,
-            )
+            # Single pass: collect dict events while tracking the first result
+            # entry and the last assistant entry instead of rescanning the list.
+            events = []
+            result_entry: dict[str, Any] | None = None
+            for item in loaded:
+                if not isinstance(item, dict):
+                    continue
+                events.append(item)
+                if result_entry is None and (item.get("type") == "result" or "result" in item):
+                    result_entry = item
+                if item.get("type") == "assistant":
+                    assistant_entry = item
             payload = result_entry or assistant_entry or (events[-1] if events else {})
             if not payload:
                 raise ParserError("Claude CLI JSON array did not contain any parsable objects")
@@ -44,7 +47,7 @@ class ClaudeJSONParser(BaseParser):
             raise ParserError("Claude CLI returned unexpected JSON payload")
 
         metadata = self._build_metadata(payload, stderr)
-        if events is not None:
+        if events is not None and self.retain_events:
             metadata["raw_events"] = events
             metadata["raw"] = loaded
 
@@ -125,13 +128,17 @@ class ClaudeJSONParser(BaseParser):
 
     def _extract_message(self, payload: dict[str, Any]) -> str | None:
         message = payload.get("message")
-        if isinstance(message, str) and message.strip():
-            return message.strip()
+        if isinstance(message, str):
+            message = message.strip()
+            if message:
+                return message
 
         error_field = payload.get("error")
         if isinstance(error_field, dict):
             error_message = error_field.get("message")
-            if isinstance(error_message, str) and error_message.strip():
-                return error_message.strip()
+            if isinstance(error_message, str):
+                error_message = error_message.strip()
+                if error_message:
+                    return error_message
 
         return None
@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar
 
-from .base import BaseParser, ParsedCLIResponse, ParserError
+from .base import BaseParser, ParsedCLIResponse, ParserError, json_loads
+
+
+@dataclass
+class _CodexParseState:
+    """Mutable accumulator threaded through the per-event handlers."""
+
+    agent_messages: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    usage: dict[str, Any] | None = None
 
 
 class CodexJSONLParser(BaseParser):
@@ -14,50 +24,91 @@ class CodexJSONLParser(BaseParser):
     name = "codex_jsonl"
 
     def parse(self, stdout: str, stderr: str) -> ParsedCLIResponse:
-        lines = [line.strip() for line in (stdout or "").splitlines() if line.strip()]
         events: list[dict[str, Any]] = []
-        agent_messages: list[str] = []
-        errors: list[str] = []
-        usage: dict[str, Any] | None = None
+        state = _CodexParseState()
+        dispatch = self._DISPATCH
+        retain_events = self.retain_events
 
-        for line in lines:
-            if not line.startswith("{"):
+        # Iterate the transcript in a single pass; materializing a stripped
+        # copy of every line up front doubles memory traffic on large outputs.
+        # split("\n") beats splitlines() here: CLI stdout never contains the
+        # exotic Unicode terminators splitlines() scans for, and any trailing
+        # "\r" is removed by the strip below.
+        for line in (stdout or "").split("\n"):
+            # Reject banner/progress noise on the first character; events
+            # start with "{", at most behind leading whitespace. Lines that
+            # already start with "{" go straight to the decoder - both json
+            # and orjson tolerate surrounding whitespace, so no stripped copy
+            # of the line is ever allocated on the common path.
+            if not line:
                 continue
+            first = line[0]
+            if first != "{":
+                if first not in " \t":
+                    continue
+                line = line.lstrip()
+                if not line or line[0] != "{":
+                    continue
             try:
-                event = json.loads(line)
+                event = json_loads(line)
             except json.JSONDecodeError:
                 continue
 
-            events.append(event)
-            event_type = event.get("type")
-            if event_type == "item.completed":
-                item = event.get("item") or {}
-                if item.get("type") == "agent_message":
-                    text = item.get("text")
-                    if isinstance(text, str) and text.strip():
-                        agent_messages.append(text.strip())
-            elif event_type == "error":
-                message = event.get("message")
-                if isinstance(message, str) and message.strip():
-                    errors.append(message.strip())
-            elif event_type == "turn.completed":
-                turn_usage = event.get("usage")
-                if isinstance(turn_usage, dict):
-                    usage = turn_usage
+            # Opted-out callers never read the transcript, so skip retaining
+            # every decoded event rather than building a list to discard.
+            if retain_events:
+                events.append(event)
+            handler = dispatch.get(event.get("type"))
+            if handler is not None:
+                handler(self, event, state)
 
+        agent_messages = state.agent_messages
+        errors = state.errors
         if not agent_messages and errors:
             agent_messages.extend(errors)
 
         if not agent_messages:
             raise ParserError("Codex CLI JSONL output did not include an agent_message item")
 
-        content = "\n\n".join(agent_messages).strip()
-        metadata: dict[str, Any] = {"events": events}
+        # Every collected message is already stripped; skip the join copy for
+        # the common single-reply case.
+        content = agent_messages[0] if len(agent_messages) == 1 else "\n\n".join(agent_messages)
+        metadata: dict[str, Any] = {"events": events} if retain_events else {}
         if errors:
             metadata["errors"] = errors
-        if usage:
-            metadata["usage"] = usage
-        if stderr and stderr.strip():
-            metadata["stderr"] = stderr.strip()
+        if state.usage:
+            metadata["usage"] = state.usage
+        stderr_text = stderr.strip() if stderr else ""
+        if stderr_text:
+            metadata["stderr"] = stderr_text
 
         return ParsedCLIResponse(content=content, metadata=metadata)
+
+    def _handle_item_completed(self, event: dict[str, Any], state: _CodexParseState) -> None:
+        item = event.get("item") or {}
+        if item.get("type") == "agent_message":
+            text = item.get("text")
+            if isinstance(text, str):
+                text = text.strip()
+                if text:
+                    state.agent_messages.append(text)
+
+    def _handle_error(self, event: dict[str, Any], state: _CodexParseState) -> None:
+        message = event.get("message")
+        if isinstance(message, str):
+            message = message.strip()
+            if message:
+                state.errors.append(message)
+
+    def _handle_turn_completed(self, event: dict[str, Any], state: _CodexParseState) -> None:
+        turn_usage = event.get("usage")
+        if isinstance(turn_usage, dict):
+            state.usage = turn_usage
+
+    # O(1) hash dispatch instead of a linear if/elif chain over event types;
+    # subclasses can extend by overriding this mapping.
+    _DISPATCH: ClassVar[dict[str, Callable[[CodexJSONLParser, dict[str, Any], _CodexParseState], None]]] = {
+        "item.completed": _handle_item_completed,
+        "error": _handle_error,
+        "turn.completed": _handle_turn_completed,
+    }
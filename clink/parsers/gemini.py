@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from .base import BaseParser, ParsedCLIResponse, ParserError
+from .base import BaseParser, ParsedCLIResponse, ParserError, json_loads
 
 
 class GeminiJSONParser(BaseParser):
@@ -18,12 +18,13 @@ class GeminiJSONParser(BaseParser):
             raise ParserError("Gemini CLI returned empty stdout while JSON output was expected")
 
         try:
-            payload: dict[str, Any] = json.loads(stdout)
+            payload: dict[str, Any] = json_loads(stdout)
         except json.JSONDecodeError as exc:  # pragma: no cover - defensive logging
             raise ParserError(f"Failed to decode Gemini CLI JSON output: {exc}") from exc
 
         response = payload.get("response")
         response_text = response.strip() if isinstance(response, str) else ""
+        stderr_text = stderr.strip() if stderr else ""
 
         metadata: dict[str, Any] = {"raw": payload}
 
@@ -43,15 +44,15 @@ class GeminiJSONParser(BaseParser):
                     metadata["latency_ms"] = api_stats.get("totalLatencyMs")
 
         if response_text:
-            if stderr and stderr.strip():
-                metadata["stderr"] = stderr.strip()
+            if stderr_text:
+                metadata["stderr"] = stderr_text
             return ParsedCLIResponse(content=response_text, metadata=metadata)
 
         fallback_message, extra_metadata = self._build_fallback_message(payload, stderr)
         if fallback_message:
             metadata.update(extra_metadata)
-            if stderr and stderr.strip():
-                metadata["stderr"] = stderr.strip()
+            if stderr_text:
+                metadata["stderr"] = stderr_text
             return ParsedCLIResponse(content=fallback_message, metadata=metadata)
 
         raise ParserError("Gemini CLI response is missing a textual 'response' field")
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shlex
-from collections.abc import Iterable
+import stat as stat_module
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from clink.constants import (
     CONFIG_DIR,
     DEFAULT_TIMEOUT_SECONDS,
@@ -23,57 +30,203 @@ from clink.models import (
     ResolvedCLIRole,
 )
 from utils.env import get_env
-from utils.file_utils import read_json_file
 
 logger = logging.getLogger("clink.registry")
 
 CONFIG_ENV_VAR = "CLI_CLIENTS_CONFIG_PATH"
 
+# Parsed config files keyed by path, guarded by (st_mtime_ns, st_size) so a
+# reload() on a long-lived server only re-reads manifests that changed.
+_CONFIG_JSON_CACHE: dict[str, tuple[int, int, dict | None]] = {}
+
+# json.loads constructs a fresh JSONDecoder per call; one bound decode method
+# shared across all config reads skips that setup cost.
+_JSON_DECODE = json.JSONDecoder().decode
+
+
+def _read_json(config_path: Path) -> dict | None:
+    """Read and decode a config file in one pass.
+
+    Reads the file as bytes and decodes UTF-8 once (utf-8-sig strips a BOM if
+    present). Returns None when the file vanishes between stat and read;
+    invalid JSON propagates as json.JSONDecodeError for _load to report.
+    """
+    try:
+        raw = config_path.read_bytes()
+    except OSError:
+        return None
+    return _JSON_DECODE(raw.decode("utf-8-sig"))
+
+
+@lru_cache(maxsize=256)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Tokenize a command string once per unique value.
+
+    shlex.split builds a full lexer and walks the string character by
+    character; command strings are identical across reloads, so memoizing the
+    (immutable) token tuple makes repeat splits a dict hit.
+    """
+    return tuple(shlex.split(command))
+
+
+# One reusable adapter skips the per-call class-level dispatch that
+# CLIClientConfig.model_validate pays on every invocation.
+_CONFIG_ADAPTER = TypeAdapter(CLIClientConfig)
+
+# Validated models keyed by path. The cached raw dict object doubles as the
+# freshness token: _cached_read_json returns the identical dict only when the
+# file was unchanged, so an identity match means the model is still valid.
+_CONFIG_MODEL_CACHE: dict[str, tuple[dict, CLIClientConfig]] = {}
+
+
+def _validated_config(config_path: Path, data: dict) -> CLIClientConfig:
+    path_str = str(config_path)
+    cached = _CONFIG_MODEL_CACHE.get(path_str)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    config = _CONFIG_ADAPTER.validate_python(data)
+    _CONFIG_MODEL_CACHE[path_str] = (data, config)
+    return config
+
+
+def _cached_read_json(config_path: Path, st: os.stat_result) -> dict | None:
+    """Read a JSON config through a stat-guarded cache.
+
+    The caller supplies the stat result gathered while discovering the file,
+    so the guard costs no extra syscall. Returns the parsed dict (callers
+    must treat it as read-only) or None when the file is unreadable; invalid
+    JSON raises json.JSONDecodeError.
+    """
+    path_str = str(config_path)
+    cached = _CONFIG_JSON_CACHE.get(path_str)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    data = _read_json(config_path)
+    _CONFIG_JSON_CACHE[path_str] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
 class RegistryLoadError(RuntimeError):
     """Raised when configuration files are invalid or missing critical data."""
 
 
+def _load_config_payload(entry: tuple[Path, os.stat_result]) -> dict | None:
+    """Read one config entry, translating decode failures for _load.
+
+    Runs on worker threads during reload, so the path is attached to the
+    error here where it is still known.
+    """
+    config_path, config_stat = entry
+    try:
+        return _cached_read_json(config_path, config_stat)
+    except json.JSONDecodeError as exc:
+        raise RegistryLoadError(f"Invalid JSON in {config_path}: {exc}") from exc
+
+
+class _LazyRoleMap(Mapping):
+    """Read-only role mapping that resolves prompt paths on first access.
+
+    Role names and args are known up front (so keys/containment/len never
+    touch the filesystem); the prompt-file stat behind each role is deferred
+    until the role is actually requested and memoized thereafter. A missing
+    prompt file therefore raises RegistryLoadError on first use of that role
+    rather than at load time.
+    """
+
+    __slots__ = ("_factories", "_resolved")
+
+    def __init__(self, factories: dict[str, Callable[[], ResolvedCLIRole]]):
+        self._factories = factories
+        self._resolved: dict[str, ResolvedCLIRole] = {}
+
+    def __getitem__(self, key: str) -> ResolvedCLIRole:
+        role = self._resolved.get(key)
+        if role is None:
+            role = self._factories[key]()
+            self._resolved[key] = role
+        return role
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
 class ClinkRegistry:
     """Loads CLI client definitions and exposes them for schema generation/runtime use."""
 
     def __init__(self) -> None:
         self._clients: dict[str, ResolvedCLIClient] = {}
+        self._client_names: list[str] = []
+        self._fingerprint: tuple[tuple[str, int, int], ...] | None = None
+        self._search_paths_cache: tuple[Path, ...] | None = None
+        self._search_paths_env: str | None = None
+        self._prompt_cache: dict[tuple[str, Path], Path] = {}
         self._load()
 
     def _load(self) -> None:
-        self._clients.clear()
-        for config_path in self._iter_config_files():
-            try:
-                data = read_json_file(str(config_path))
-            except json.JSONDecodeError as exc:
-                raise RegistryLoadError(f"Invalid JSON in {config_path}: {exc}") from exc
-
+        config_entries = list(self._iter_config_files())
+
+        # Skip the full parse/validate/resolve pass when the config files on
+        # disk are byte-for-byte the ones this registry was built from.
+        fingerprint = self._fingerprint_for(config_entries)
+        if self._clients and fingerprint == self._fingerprint:
+            logger.debug("CLI configurations unchanged; skipping registry reload")
+            return
+
+        # Reloads must re-check prompt existence, so the memo only spans one
+        # load pass.
+        self._prompt_cache.clear()
+
+        # Build into a local dict and publish it with a single attribute swap:
+        # concurrent readers see either the previous mapping or the new one,
+        # never a half-populated registry (and a failed reload leaves the old
+        # clients intact).
+        # Overlap the read+decode stage across files: the GIL is released
+        # during file reads, so a small pool hides per-file latency on slow
+        # (e.g. network-mounted) storage. Validation and resolution remain
+        # serial on this thread. map preserves input order, so override
+        # precedence between config files is unchanged.
+        if len(config_entries) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(config_entries))) as pool:
+                payloads = list(pool.map(_load_config_payload, config_entries))
+        else:
+            payloads = [_load_config_payload(entry) for entry in config_entries]
+
+        new_clients: dict[str, ResolvedCLIClient] = {}
+        for (config_path, _config_stat), data in zip(config_entries, payloads):
             if not data:
                 logger.debug("Skipping empty configuration file: %s", config_path)
                 continue
 
-            config = CLIClientConfig.model_validate(data)
+            config = _validated_config(config_path, data)
             resolved = self._resolve_config(config, source_path=config_path)
-            key = resolved.name.lower()
-            if key in self._clients:
+            key = resolved.name_lower
+            if key in new_clients:
                 logger.info("Overriding CLI configuration for '%s' from %s", resolved.name, config_path)
             else:
                 logger.debug("Loaded CLI configuration for '%s' from %s", resolved.name, config_path)
-            self._clients[key] = resolved
+            new_clients[key] = resolved
 
-        if not self._clients:
+        if not new_clients:
             raise RegistryLoadError(
                 "No CLI clients configured. Ensure conf/cli_clients contains at least one definition or set "
                 f"{CONFIG_ENV_VAR}."
             )
 
+        self._clients = new_clients
+        self._client_names = sorted(client.name for client in new_clients.values())
+        self._fingerprint = fingerprint
+
     def reload(self) -> None:
         """Reload configurations from disk."""
         self._load()
 
     def list_clients(self) -> list[str]:
-        return sorted(client.name for client in self._clients.values())
+        # Sorted once per load; callers get a copy they can mutate freely.
+        return list(self._client_names)
 
     def list_roles(self, cli_name: str) -> list[str]:
         config = self.get_client(cli_name)
@@ -90,38 +243,69 @@ class ClinkRegistry:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _iter_config_files(self) -> Iterable[Path]:
+    @staticmethod
+    def _fingerprint_for(config_entries: list[tuple[Path, os.stat_result]]) -> tuple[tuple[str, int, int], ...]:
+        return tuple((str(path), st.st_mtime_ns, st.st_size) for path, st in config_entries)
+
+    def _search_paths(self) -> tuple[Path, ...]:
+        """Return the deduped config search paths, rebuilt only when the env override changes."""
+        env_path_raw = get_env(CONFIG_ENV_VAR)
+        if self._search_paths_cache is not None and env_path_raw == self._search_paths_env:
+            return self._search_paths_cache
+
         search_paths: list[Path] = []
 
         # 1. Built-in configs
         search_paths.append(CONFIG_DIR)
 
         # 2. CLI_CLIENTS_CONFIG_PATH environment override (file or directory)
-        env_path_raw = get_env(CONFIG_ENV_VAR)
         if env_path_raw:
-            env_path = Path(env_path_raw).expanduser()
-            search_paths.append(env_path)
+            search_paths.append(Path(env_path_raw).expanduser())
 
         # 3. User overrides in ~/.pal/cli_clients
         search_paths.append(USER_CONFIG_DIR)
 
+        deduped: list[Path] = []
         seen: set[Path] = set()
-
         for base in search_paths:
-            if not base:
-                continue
-            if base in seen:
+            if base and base not in seen:
+                seen.add(base)
+                deduped.append(base)
+
+        self._search_paths_env = env_path_raw
+        self._search_paths_cache = tuple(deduped)
+        return self._search_paths_cache
+
+    def _iter_config_files(self) -> Iterable[tuple[Path, os.stat_result]]:
+        """Yield each discovered config file with the stat gathered finding it.
+
+        Passing the stat_result along lets the fingerprint and the JSON cache
+        reuse it instead of re-statting every file on each reload.
+        """
+        for base in self._search_paths():
+            # One stat decides file vs directory; scandir then classifies the
+            # directory entries from its own results instead of per-path stats.
+            try:
+                base_stat = os.stat(base)
+            except OSError:
+                logger.debug("Configuration path does not exist: %s", base)
                 continue
-            seen.add(base)
 
-            if base.is_file() and base.suffix.lower() == ".json":
-                yield base
+            if stat_module.S_ISREG(base_stat.st_mode) and base.suffix.lower() == ".json":
+                yield base, base_stat
                 continue
 
-            if base.is_dir():
-                for path in sorted(base.glob("*.json")):
-                    if path.is_file():
-                        yield path
+            if stat_module.S_ISDIR(base_stat.st_mode):
+                # Filter before sorting so only the .json matches are compared
+                # and the list is sorted in place rather than via sorted()'s
+                # copy of every directory entry.
+                with os.scandir(base) as entries:
+                    matches = [entry for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+                matches.sort(key=lambda entry: entry.name)
+                for entry in matches:
+                    # entry.stat() is served from the scandir cache on
+                    # platforms that provide it (no extra syscall).
+                    yield Path(entry.path), entry.stat()
             else:
                 logger.debug("Configuration path does not exist: %s", base)
 
@@ -136,8 +320,8 @@ class ClinkRegistry:
 
         executable = self._resolve_executable(raw, internal_defaults, source_path)
 
-        internal_args = list(internal_defaults.additional_args) if internal_defaults else []
-        config_args = list(raw.additional_args)
+        internal_args = tuple(internal_defaults.additional_args) if internal_defaults else ()
+        config_args = tuple(raw.additional_args)
 
         timeout_seconds = raw.timeout_seconds or (
             internal_defaults.timeout_seconds if internal_defaults else DEFAULT_TIMEOUT_SECONDS
@@ -151,9 +335,13 @@ class ClinkRegistry:
 
         runner_name = internal_defaults.runner if internal_defaults else None
 
+        # Path.parent builds a new Path each access; compute it once and hand
+        # it to every helper that resolves relative paths.
+        base_dir = source_path.parent
+
         env = self._merge_env(raw, internal_defaults)
-        working_dir = self._resolve_optional_path(raw.working_dir, source_path.parent)
-        roles = self._resolve_roles(raw, internal_defaults, source_path)
+        working_dir = self._resolve_optional_path(raw.working_dir, base_dir)
+        roles = self._resolve_roles(raw, internal_defaults, base_dir)
 
         output_to_file = raw.output_to_file
 
@@ -176,80 +364,129 @@ class ClinkRegistry:
         raw: CLIClientConfig,
         internal_defaults: CLIInternalDefaults | None,
         source_path: Path,
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         command = raw.command
         if not command:
             raise RegistryLoadError(f"CLI '{raw.name}' must specify a 'command' in configuration")
-        return shlex.split(command)
+        return _split_command(command)
 
     def _merge_env(
         self,
         raw: CLIClientConfig,
         internal_defaults: CLIInternalDefaults | None,
     ) -> dict[str, str]:
-        merged: dict[str, str] = {}
-        if internal_defaults and internal_defaults.env:
-            merged.update(internal_defaults.env)
-        merged.update(raw.env)
-        return merged
+        base = internal_defaults.env if internal_defaults and internal_defaults.env else None
+        if base is None:
+            return dict(raw.env)
+        return {**base, **raw.env}
 
     def _resolve_roles(
         self,
         raw: CLIClientConfig,
         internal_defaults: CLIInternalDefaults | None,
-        source_path: Path,
-    ) -> dict[str, ResolvedCLIRole]:
-        roles: dict[str, CLIRoleConfig] = dict(raw.roles)
-
+        base_dir: Path,
+    ) -> Mapping[str, ResolvedCLIRole]:
         default_role_prompt = internal_defaults.default_role_prompt if internal_defaults else None
+
+        if not raw.roles:
+            # Common case: the config defines no roles, so only the implicit
+            # default exists. Build it directly instead of round-tripping
+            # through an intermediate CLIRoleConfig dict.
+            if not default_role_prompt:
+                raise RegistryLoadError(f"Role 'default' for CLI '{raw.name}' must define a prompt_path")
+            return _LazyRoleMap({"default": self._role_factory("default", default_role_prompt, (), None, base_dir)})
+
+        roles: dict[str, CLIRoleConfig] = dict(raw.roles)
         if "default" not in roles:
             roles["default"] = CLIRoleConfig(prompt_path=default_role_prompt)
         elif roles["default"].prompt_path is None and default_role_prompt:
             roles["default"].prompt_path = default_role_prompt
 
-        resolved: dict[str, ResolvedCLIRole] = {}
+        # Validate that every role has a prompt configured (cheap, no I/O),
+        # but defer the prompt-file stat behind each role until first use:
+        # most processes only ever exercise a subset of the configured roles.
+        factories: dict[str, Callable[[], ResolvedCLIRole]] = {}
         for role_name, role_config in roles.items():
             prompt_path_str = role_config.prompt_path or default_role_prompt
             if not prompt_path_str:
                 raise RegistryLoadError(f"Role '{role_name}' for CLI '{raw.name}' must define a prompt_path")
-            prompt_path = self._resolve_prompt_path(prompt_path_str, source_path.parent)
-            resolved[role_name] = ResolvedCLIRole(
+            factories[role_name] = self._role_factory(
+                role_name,
+                prompt_path_str,
+                tuple(role_config.role_args),
+                role_config.description,
+                base_dir,
+            )
+        return _LazyRoleMap(factories)
+
+    def _role_factory(
+        self,
+        role_name: str,
+        prompt_path_str: str,
+        role_args: tuple[str, ...],
+        description: str | None,
+        base_dir: Path,
+    ) -> Callable[[], ResolvedCLIRole]:
+        def build() -> ResolvedCLIRole:
+            return ResolvedCLIRole(
                 name=role_name,
-                prompt_path=prompt_path,
-                role_args=list(role_config.role_args),
-                description=role_config.description,
+                prompt_path=self._resolve_prompt_path(prompt_path_str, base_dir),
+                role_args=role_args,
+                description=description,
             )
-        return resolved
+
+        return build
 
     def _resolve_prompt_path(self, prompt_path: str, base_dir: Path) -> Path:
-        resolved = self._resolve_path(prompt_path, base_dir)
-        if not resolved.exists():
+        # CLIs commonly share prompt files (every builtin points at the same
+        # default per role), so memoize per (candidate, base_dir) within a
+        # load to avoid repeating the locate/stat work.
+        key = (prompt_path, base_dir)
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            return cached
+        resolved, exists = self._locate_path(prompt_path, base_dir)
+        if not exists:
             raise RegistryLoadError(f"Prompt file not found: {resolved}")
+        self._prompt_cache[key] = resolved
         return resolved
 
     def _resolve_optional_path(self, candidate: str | None, base_dir: Path) -> Path | None:
         if not candidate:
             return None
-        return self._resolve_path(candidate, base_dir)
+        return self._locate_path(candidate, base_dir)[0]
+
+    def _locate_path(self, candidate: str, base_dir: Path) -> tuple[Path, bool]:
+        """Resolve a candidate against base_dir with a PROJECT_ROOT fallback.
 
-    def _resolve_path(self, candidate: str, base_dir: Path) -> Path:
+        Returns the chosen path and whether it exists, probing each location
+        with a single stat instead of eagerly resolve()-ing both.
+        """
         path = Path(candidate)
         if path.is_absolute():
-            return path
+            return path, path.exists()
 
-        candidate_path = (base_dir / path).resolve()
+        candidate_path = base_dir / path
         if candidate_path.exists():
-            return candidate_path
+            return candidate_path.resolve(), True
 
-        project_relative = (PROJECT_ROOT / path).resolve()
-        return project_relative
+        project_relative = PROJECT_ROOT / path
+        return project_relative.resolve(), project_relative.exists()
 
 
 _REGISTRY: ClinkRegistry | None = None
+_REGISTRY_LOCK = threading.Lock()
 
 
 def get_registry() -> ClinkRegistry:
     global _REGISTRY
-    if _REGISTRY is None:
-        _REGISTRY = ClinkRegistry()
-    return _REGISTRY
+    # Double-checked locking: the steady state is one global load with no
+    # lock; only first-time callers contend, so two threads cannot both pay
+    # for the disk-backed construction.
+    registry = _REGISTRY
+    if registry is not None:
+        return registry
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = ClinkRegistry()
+        return _REGISTRY
@@ -19,6 +19,10 @@ logger = logging.getLogger(__name__)
 
 CAPABILITY_FIELD_NAMES = {field.name for field in fields(ModelCapabilities)}
 
+# Resolved once at import time so each registry construction avoids the
+# syscall-heavy Path.resolve() walk used to locate the bundled conf directory.
+_DEFAULT_CONF_DIR = Path(__file__).resolve().parents[3] / "conf"
+
 
 class CustomModelRegistryBase:
     """Load and expose capability metadata from a JSON manifest."""
@@ -34,7 +38,7 @@ class CustomModelRegistryBase:
         self._default_filename = default_filename
         self._use_resources = False
         self._resource_package = "conf"
-        self._default_path = Path(__file__).resolve().parents[3] / "conf" / default_filename
+        self._default_path = _DEFAULT_CONF_DIR / default_filename
 
         if config_path:
             self.config_path = Path(config_path)
@@ -51,7 +55,7 @@ class CustomModelRegistryBase:
                     else:
                         raise AttributeError("resource accessor not available")
                 except Exception:
-                    self.config_path = Path(__file__).resolve().parents[3] / "conf" / default_filename
+                    self.config_path = _DEFAULT_CONF_DIR / default_filename
 
         self.alias_map: dict[str, str] = {}
         self.model_map: dict[str, ModelCapabilities] = {}
@@ -25,12 +25,12 @@ class DummyProcess:
 @pytest.fixture()
 def claude_agent():
     prompt_path = Path("systemprompts/clink/default.txt").resolve()
-    role = ResolvedCLIRole(name="default", prompt_path=prompt_path, role_args=[])
+    role = ResolvedCLIRole(name="default", prompt_path=prompt_path, role_args=())
     client = ResolvedCLIClient(
         name="claude",
-        executable=["claude"],
-        internal_args=["--print", "--output-format", "json"],
-        config_args=["--permission-mode", "acceptEdits"],
+        executable=("claude",),
+        internal_args=("--print", "--output-format", "json"),
+        config_args=("--permission-mode", "acceptEdits"),
         env={},
         timeout_seconds=30,
         parser="claude_json",
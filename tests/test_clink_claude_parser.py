@@ -8,18 +8,24 @@ from clink.parsers.base import ParserError
 from clink.parsers.claude import ClaudeJSONParser
 
 
-def _build_success_payload() -> str:
-    return (
-        '{"type":"result","subtype":"success","is_error":false,"duration_ms":1234,'
-        '"duration_api_ms":1200,"num_turns":1,"result":"42","session_id":"abc","total_cost_usd":0.12,'
-        '"usage":{"input_tokens":10,"output_tokens":5},'
-        '"modelUsage":{"claude-sonnet-4-5-20250929":{"inputTokens":10,"outputTokens":5}}}'
-    )
+@pytest.fixture(scope="module")
+def parser() -> ClaudeJSONParser:
+    """Parsers keep no per-parse state, so one instance serves the module."""
+    return ClaudeJSONParser()
 
 
-def test_claude_parser_extracts_result_and_metadata():
-    parser = ClaudeJSONParser()
-    stdout = _build_success_payload()
+# Built once at import: the payload is pure data shared by every test that
+# needs a successful result.
+_SUCCESS_PAYLOAD = (
+    '{"type":"result","subtype":"success","is_error":false,"duration_ms":1234,'
+    '"duration_api_ms":1200,"num_turns":1,"result":"42","session_id":"abc","total_cost_usd":0.12,'
+    '"usage":{"input_tokens":10,"output_tokens":5},'
+    '"modelUsage":{"claude-sonnet-4-5-20250929":{"inputTokens":10,"outputTokens":5}}}'
+)
+
+
+def test_claude_parser_extracts_result_and_metadata(parser):
+    stdout = _SUCCESS_PAYLOAD
 
     parsed = parser.parse(stdout=stdout, stderr="")
 
@@ -29,8 +35,7 @@ def test_claude_parser_extracts_result_and_metadata():
     assert parsed.metadata["is_error"] is False
 
 
-def test_claude_parser_falls_back_to_message():
-    parser = ClaudeJSONParser()
+def test_claude_parser_falls_back_to_message(parser):
     stdout = '{"type":"result","is_error":true,"message":"API error message"}'
 
     parsed = parser.parse(stdout=stdout, stderr="warning")
@@ -40,15 +45,13 @@ def test_claude_parser_falls_back_to_message():
     assert parsed.metadata["stderr"] == "warning"
 
 
-def test_claude_parser_requires_output():
-    parser = ClaudeJSONParser()
+def test_claude_parser_requires_output(parser):
 
     with pytest.raises(ParserError):
         parser.parse(stdout="", stderr="")
 
 
-def test_claude_parser_handles_array_payload_with_result_event():
-    parser = ClaudeJSONParser()
+def test_claude_parser_handles_array_payload_with_result_event(parser):
     events = [
         {"type": "system", "session_id": "abc"},
         {"type": "assistant", "message": "intermediate"},
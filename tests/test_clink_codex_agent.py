@@ -22,12 +22,12 @@ class DummyProcess:
 @pytest.fixture()
 def codex_agent():
     prompt_path = Path("systemprompts/clink/codex_default.txt").resolve()
-    role = ResolvedCLIRole(name="default", prompt_path=prompt_path, role_args=[])
+    role = ResolvedCLIRole(name="default", prompt_path=prompt_path, role_args=())
     client = ResolvedCLIClient(
         name="codex",
-        executable=["codex"],
-        internal_args=["exec"],
-        config_args=["--json", "--dangerously-bypass-approvals-and-sandbox"],
+        executable=("codex",),
+        internal_args=("exec",),
+        config_args=("--json", "--dangerously-bypass-approvals-and-sandbox"),
         env={},
         timeout_seconds=30,
         parser="codex_jsonl",
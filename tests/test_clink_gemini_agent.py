@@ -22,12 +22,12 @@ class DummyProcess:
 @pytest.fixture()
 def gemini_agent():
     prompt_path = Path("systemprompts/clink/gemini_default.txt").resolve()
-    role = ResolvedCLIRole(name="default", prompt_path=prompt_path, role_args=[])
+    role = ResolvedCLIRole(name="default", prompt_path=prompt_path, role_args=())
     client = ResolvedCLIClient(
         name="gemini",
-        executable=["gemini"],
-        internal_args=[],
-        config_args=[],
+        executable=("gemini",),
+        internal_args=(),
+        config_args=(),
         env={},
         timeout_seconds=30,
         parser="gemini_json",
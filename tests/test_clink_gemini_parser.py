@@ -5,31 +5,37 @@ import pytest
 from clink.parsers.gemini import GeminiJSONParser, ParserError
 
 
-def _build_rate_limit_stdout() -> str:
-    return (
-        "{\n"
-        '  "response": "",\n'
-        '  "stats": {\n'
-        '    "models": {\n'
-        '      "gemini-2.5-pro": {\n'
-        '        "api": {\n'
-        '          "totalRequests": 5,\n'
-        '          "totalErrors": 5,\n'
-        '          "totalLatencyMs": 13319\n'
-        "        },\n"
-        '        "tokens": {"prompt": 0, "candidates": 0, "total": 0, "cached": 0, "thoughts": 0, "tool": 0}\n'
-        "      }\n"
-        "    },\n"
-        '    "tools": {"totalCalls": 0},\n'
-        '    "files": {"totalLinesAdded": 0, "totalLinesRemoved": 0}\n'
-        "  }\n"
-        "}"
-    )
-
-
-def test_gemini_parser_handles_rate_limit_empty_response():
-    parser = GeminiJSONParser()
-    stdout = _build_rate_limit_stdout()
+@pytest.fixture(scope="module")
+def parser() -> GeminiJSONParser:
+    """Parsers keep no per-parse state, so one instance serves the module."""
+    return GeminiJSONParser()
+
+
+# Built once at import: the payload is pure data shared by the rate-limit
+# tests.
+_RATE_LIMIT_STDOUT = (
+    "{\n"
+    '  "response": "",\n'
+    '  "stats": {\n'
+    '    "models": {\n'
+    '      "gemini-2.5-pro": {\n'
+    '        "api": {\n'
+    '          "totalRequests": 5,\n'
+    '          "totalErrors": 5,\n'
+    '          "totalLatencyMs": 13319\n'
+    "        },\n"
+    '        "tokens": {"prompt": 0, "candidates": 0, "total": 0, "cached": 0, "thoughts": 0, "tool": 0}\n'
+    "      }\n"
+    "    },\n"
+    '    "tools": {"totalCalls": 0},\n'
+    '    "files": {"totalLinesAdded": 0, "totalLinesRemoved": 0}\n'
+    "  }\n"
+    "}"
+)
+
+
+def test_gemini_parser_handles_rate_limit_empty_response(parser):
+    stdout = _RATE_LIMIT_STDOUT
     stderr = "Attempt 1 failed with status 429. Retrying with backoff... ApiError: quota exceeded"
 
     parsed = parser.parse(stdout, stderr)
@@ -40,8 +46,7 @@ def test_gemini_parser_handles_rate_limit_empty_response():
     assert "Attempt 1 failed" in parsed.metadata.get("stderr", "")
 
 
-def test_gemini_parser_still_errors_when_no_fallback_available():
-    parser = GeminiJSONParser()
+def test_gemini_parser_still_errors_when_no_fallback_available(parser):
     stdout = '{"response": "", "stats": {}}'
 
     with pytest.raises(ParserError):
@@ -4,8 +4,13 @@ from clink.parsers.base import ParserError
 from clink.parsers.codex import CodexJSONLParser
 
 
-def test_codex_parser_success():
-    parser = CodexJSONLParser()
+@pytest.fixture(scope="module")
+def parser() -> CodexJSONLParser:
+    """Parsers keep no per-parse state, so one instance serves the module."""
+    return CodexJSONLParser()
+
+
+def test_codex_parser_success(parser):
     stdout = """
 {"type":"item.completed","item":{"id":"item_0","type":"agent_message","text":"Hello"}}
 {"type":"turn.completed","usage":{"input_tokens":10,"output_tokens":5}}
@@ -15,8 +20,7 @@ def test_codex_parser_success():
     assert parsed.metadata["usage"]["output_tokens"] == 5
 
 
-def test_codex_parser_requires_agent_message():
-    parser = CodexJSONLParser()
+def test_codex_parser_requires_agent_message(parser):
     stdout = '{"type":"turn.completed"}'
     with pytest.raises(ParserError):
         parser.parse(stdout=stdout, stderr="")
@@ -61,12 +61,12 @@ def test_registry_lists_roles():
     assert "default" in registry.list_roles("codex")
     codex_client = registry.get_client("codex")
     # Verify codex uses --enable web_search_request (not --search which is unsupported by exec)
-    assert codex_client.config_args == [
+    assert codex_client.config_args == (
         "--json",
         "--dangerously-bypass-approvals-and-sandbox",
         "--enable",
         "web_search_request",
-    ]
+    )
 
 
 @pytest.mark.asyncio
@@ -319,8 +319,9 @@ class CLinkTool(SimpleTool):
         }
         metadata.update(result.parsed.metadata)
 
-        if result.stderr.strip():
-            metadata.setdefault("stderr", result.stderr.strip())
+        stderr_text = result.stderr.strip()
+        if stderr_text:
+            metadata.setdefault("stderr", stderr_text)
         if result.output_file_content and "raw" not in metadata:
             metadata["raw_output_file"] = result.output_file_content
         return metadata
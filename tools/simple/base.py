@@ -12,9 +12,14 @@ and inherit all the conversation, file processing, and model handling
 capabilities from BaseTool.
 """
 
+import logging
+import os
 from abc import abstractmethod
 from typing import Any, Optional
 
+from mcp.types import TextContent
+
+from tools.models import ContinuationOffer, ToolOutput
 from tools.shared.base_models import ToolRequest
 from tools.shared.base_tool import BaseTool
 from tools.shared.exceptions import ToolExecutionError
@@ -272,12 +277,6 @@ class SimpleTool(BaseTool):
 
         This method replicates the proven execution pattern while using SimpleTool hooks.
         """
-        import logging
-
-        from mcp.types import TextContent
-
-        from tools.models import ToolOutput
-
         logger = logging.getLogger(f"tools.{self.get_name()}")
 
         try:
@@ -594,8 +593,6 @@ class SimpleTool(BaseTool):
         This simplified version focuses on the SimpleTool pattern: format the response
         using the format_response hook, then handle conversation continuation.
         """
-        from tools.models import ToolOutput
-
         # Format the response using the hook method
         formatted_response = self.format_response(raw_text, request, model_info)
 
@@ -688,8 +685,6 @@ class SimpleTool(BaseTool):
         self, content: str, continuation_data: dict, request, model_info: Optional[dict] = None
     ):
         """Create response with continuation offer following old base.py pattern"""
-        from tools.models import ContinuationOffer, ToolOutput
-
         try:
             if not self.get_request_continuation_id(request):
                 self._record_assistant_turn(
@@ -902,8 +897,6 @@ Please provide a thoughtful, comprehensive response:"""
         validation_content = self.get_prompt_content_for_size_validation(user_content)
         size_check = self.check_prompt_size(validation_content)
         if size_check:
-            from tools.models import ToolOutput
-
             raise ValueError(f"MCP_SIZE_CHECK:{ToolOutput(**size_check).model_dump_json()}")
 
         return user_content
@@ -950,8 +943,6 @@ Please provide a thoughtful, comprehensive response:"""
         Returns:
             Optional[str]: Error message if validation fails, None if all paths are valid
         """
-        import os
-
         # Check if request has absolute file paths attribute (legacy tools may still provide 'files')
         files = self.get_request_files(request)
         if files:
@@ -1368,9 +1368,11 @@ class BaseWorkflowMixin(ABC):
 
     def _update_consolidated_findings(self, step_data: dict):
         """Update consolidated findings with new step data"""
-        self.consolidated_findings.files_checked.update(step_data.get("files_checked", []))
-        self.consolidated_findings.relevant_files.update(step_data.get("relevant_files", []))
-        self.consolidated_findings.relevant_context.update(step_data.get("relevant_context", []))
+        # "or ()" instead of a [] default: the empty tuple is a constant, so no
+        # throwaway list is allocated when a step omits (or nulls) these keys.
+        self.consolidated_findings.files_checked.update(step_data.get("files_checked") or ())
+        self.consolidated_findings.relevant_files.update(step_data.get("relevant_files") or ())
+        self.consolidated_findings.relevant_context.update(step_data.get("relevant_context") or ())
         self.consolidated_findings.findings.append(f"Step {step_data['step_number']}: {step_data['findings']}")
         if step_data.get("hypothesis"):
             self.consolidated_findings.hypotheses.append(
@@ -48,6 +48,11 @@ from .file_types import BINARY_EXTENSIONS, CODE_EXTENSIONS, IMAGE_EXTENSIONS, TE
 from .security_config import EXCLUDED_DIRS, is_dangerous_path
 from .token_utils import DEFAULT_CONTEXT_WINDOW, estimate_tokens
 
+# Server root resolved once at import time: these anchors never change for the
+# lifetime of the process, so per-call Path.resolve() syscalls are wasted work.
+_SERVER_ROOT = Path(__file__).parent.parent.resolve()
+_BUILTIN_CUSTOM_MODELS_CONFIG = (Path(__file__).parent.parent / "conf" / "custom_models.json").resolve()
+
 
 def _is_builtin_custom_models_config(path_str: str) -> bool:
     """
@@ -65,13 +70,9 @@ def _is_builtin_custom_models_config(path_str: str) -> bool:
     try:
         path = Path(path_str)
 
-        # Get the server root by going up from this file: utils/file_utils.py -> server_root
-        server_root = Path(__file__).parent.parent
-        builtin_config = server_root / "conf" / "custom_models.json"
-
         # Check if the path resolves to the same file as our built-in config
         # This handles both relative and absolute paths to the same file
-        return path.resolve() == builtin_config.resolve()
+        return path.resolve() == _BUILTIN_CUSTOM_MODELS_CONFIG
 
     except Exception:
         # If path resolution fails, it's not our built-in config
@@ -97,13 +98,9 @@ def is_mcp_directory(path: Path) -> bool:
     if not path.is_dir():
         return False
 
-    # Get the directory where the MCP server is running from
-    # __file__ is utils/file_utils.py, so parent.parent is the MCP root
-    mcp_server_dir = Path(__file__).parent.parent.resolve()
-
     # Check if the given path is the MCP server directory or a subdirectory
     try:
-        path.resolve().relative_to(mcp_server_dir)
+        path.resolve().relative_to(_SERVER_ROOT)
         logger.info(f"Detected MCP server directory at {path}, will exclude from scanning")
         return True
     except ValueError: